@@ -17,7 +17,8 @@ DEFAULT_CONFIG = {
     },
     "output": {
         "output_dir": "~/GoogleDriveMount/Web/Completed/Final",
-        "prefix": "final_"
+        "prefix": "final_",
+        "save_interval": 10
     },
     "ui": {
         "button_primary_color": "#4285f4",
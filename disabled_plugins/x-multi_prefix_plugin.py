@@ -1,73 +1,158 @@
 #!/usr/bin/env python3
 # Save this as plugins/multi_prefix_plugin.py
 
-from PyQt5.QtWidgets import (
-    QPushButton, QMessageBox, QVBoxLayout, QDialog, QLabel, QLineEdit, 
-    QHBoxLayout, QListWidget, QListWidgetItem
-)
+# Only what plugin startup itself needs; the dialog-only widget classes are
+# imported lazily in PrefixDialog so loading the plugin doesn't pay for them
+from PyQt5.QtWidgets import QPushButton, QMessageBox, QDialog
 from PyQt5.QtCore import Qt
+
+import functools
+import logging
 import os
 import json
+import re
+import sys
+import threading
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor, as_completed
+
+logger = logging.getLogger(__name__)
+
+_PLUGIN_DIR = os.path.dirname(os.path.abspath(__file__))
+_DEFAULT_CONFIG = os.path.join(_PLUGIN_DIR, 'multi_prefix_config.json')
+
+# Prefer orjson for config I/O (C-level parse/serialize); fall back to stdlib json
+try:
+    import orjson
+    _loads = orjson.loads
+    _dumps = orjson.dumps
+except ImportError:
+    _loads = json.loads
+    _dumps = lambda obj: json.dumps(obj).encode('utf-8')
+
+# Cache of parsed prefix config files: path -> (st_mtime_ns, prefix list).
+# Lets repeated plugin instantiations skip disk I/O when the file is unchanged.
+_PREFIX_CACHE = {}
+
+# Max number of memoized scrape results kept per plugin instance
+_SCRAPE_CACHE_MAX = 4096
+
+# Cap on concurrent alternate-prefix scrapes so we don't hammer Katom
+_MAX_ALT_WORKERS = 8
+
+# Sentinel title returned by scrape_katom on a miss; interned so the identity
+# fast path in _is_miss can fire when upstream returns the same literal
+_MISS_EXACT = sys.intern("Title not found")
+_MISS_RE = re.compile(r"not found", re.IGNORECASE)
 
 class Plugin:
     """Plugin that allows trying multiple prefixes when scraping Katom"""
-    
+
+    __slots__ = (
+        'main_window', 'name', 'version', 'description', 'button',
+        'config_file', 'prefixes', '_scrape_cache', '_scrape_lock',
+        '_alt_cache', '_pool',
+    )
+
     def __init__(self, main_window):
         self.main_window = main_window
         self.name = "Multi-Prefix Plugin"
         self.version = "1.0.0"
         self.description = "Try multiple prefixes when scraping Katom"
         self.button = None
-        self.config_file = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'multi_prefix_config.json')
+        self.config_file = _DEFAULT_CONFIG
         self.prefixes = self.load_prefixes()
+        # LRU memo of (model_number, prefix) -> scrape result, so repeated
+        # misses against the same pair don't re-hit the network
+        self._scrape_cache = OrderedDict()
+        self._scrape_lock = threading.Lock()
+        # Per-primary-prefix tuples of alternate prefixes, rebuilt lazily
+        # whenever the prefix list changes
+        self._alt_cache = {}
+        # Shared executor for alternate-prefix scrapes, created on first use
+        self._pool = None
     
     def load_prefixes(self):
-        """Load prefixes from config file"""
-        if os.path.exists(self.config_file):
-            try:
-                with open(self.config_file, 'r') as f:
-                    return json.load(f)
-            except:
-                return ["605", "123", "456"]  # Default prefixes
-        else:
+        """Load prefixes from config file (cached by modification time)"""
+        try:
+            mtime_ns = os.stat(self.config_file).st_mtime_ns
+        except OSError:
             return ["605", "123", "456"]  # Default prefixes
-    
+
+        # Reuse the parsed list if the file hasn't changed since we last read it
+        cached = _PREFIX_CACHE.get(self.config_file)
+        if cached and cached[0] == mtime_ns:
+            return list(cached[1])
+
+        try:
+            with open(self.config_file, 'rb') as f:
+                prefixes = _loads(f.read())
+        except (OSError, ValueError):  # ValueError covers both json and orjson decode errors
+            return ["605", "123", "456"]  # Default prefixes
+
+        _PREFIX_CACHE[self.config_file] = (mtime_ns, list(prefixes))
+        return prefixes
+
     def save_prefixes(self):
-        """Save prefixes to config file"""
+        """Save prefixes to config file atomically"""
         try:
-            with open(self.config_file, 'w') as f:
-                json.dump(self.prefixes, f)
-        except Exception as e:
-            print(f"Error saving prefixes: {e}")
+            # Write to a temp file and rename into place - os.replace is a
+            # near-instant metadata operation, so the UI thread never waits
+            # on an in-place truncate+write hitting slow disk
+            tmp_file = self.config_file + '.tmp'
+            with open(tmp_file, 'wb') as f:
+                f.write(_dumps(self.prefixes))
+            os.replace(tmp_file, self.config_file)
+            # Keep the cache in sync so the next load is a hit
+            _PREFIX_CACHE[self.config_file] = (os.stat(self.config_file).st_mtime_ns, self.prefixes[:])
+            self._alt_cache.clear()
+        except OSError:
+            logger.exception("Error saving prefixes to %s", self.config_file)
     
     def initialize(self):
         """Called when the plugin is loaded"""
-        print(f"Initializing {self.name} v{self.version}")
+        logger.info("Initializing %s v%s", self.name, self.version)
         
         # Add a button to the main window's button layout
         self.button = QPushButton("Multi-Prefix Settings", self.main_window)
         self.button.setObjectName("secondaryButton")
         self.button.clicked.connect(self.on_button_clicked)
         
-        # Find the button layout in the main window
-        button_layout = None
-        for i in range(self.main_window.layout().count()):
-            item = self.main_window.layout().itemAt(i)
-            if item and item.layout() and any(isinstance(item.layout().itemAt(j).widget(), QPushButton) 
-                 for j in range(item.layout().count()) if item.layout().itemAt(j).widget()):
-                button_layout = item.layout()
-                break
-        
+        # Find the button layout in the main window. The scan below crosses the
+        # Python/C++ boundary once per layout item, so memoize the result on the
+        # main window and let subsequent plugins reuse it.
+        button_layout = getattr(self.main_window, '_plugin_button_layout', None)
+        if button_layout is None:
+            # Collect the window's sub-layouts once, then let Qt enumerate the
+            # buttons in a single C++-side traversal instead of probing every
+            # QLayoutItem for its widget from Python
+            main_layout = self.main_window.layout()
+            sub_layouts = []
+            for i in range(main_layout.count()):
+                item = main_layout.itemAt(i)
+                if item and item.layout():
+                    sub_layouts.append(item.layout())
+            for btn in self.main_window.findChildren(QPushButton):
+                for sub_layout in sub_layouts:
+                    if sub_layout.indexOf(btn) != -1:
+                        button_layout = sub_layout
+                        break
+                if button_layout:
+                    break
+            if button_layout:
+                self.main_window._plugin_button_layout = button_layout
+
         if button_layout:
             button_layout.addWidget(self.button)
         else:
-            print("Could not find button layout")
+            logger.warning("Could not find button layout")
     
     def on_button_clicked(self):
         """Handle the button click event"""
         dialog = PrefixDialog(self.prefixes, self.main_window)
         if dialog.exec_():
             self.prefixes = dialog.get_prefixes()
+            self._alt_cache.clear()
             self.save_prefixes()
             QMessageBox.information(
                 self.main_window, 
@@ -81,41 +166,117 @@ class Plugin:
         # Store the original method
         if not hasattr(sheet_row, 'original_scrape_katom'):
             sheet_row.original_scrape_katom = sheet_row.scrape_katom
-            # Replace with our enhanced version
-            sheet_row.scrape_katom = lambda model_number, prefix: self.enhanced_scrape_katom(sheet_row, model_number, prefix)
+            # Replace with our enhanced version; partial dispatches in C with
+            # one less Python frame than a lambda wrapping the call
+            sheet_row.scrape_katom = functools.partial(self.enhanced_scrape_katom, sheet_row)
         return True
     
+    def _cached_scrape(self, sheet_row, model_number, prefix):
+        """Call the original scrape_katom, memoizing results per (model, prefix)"""
+        key = (model_number, prefix)
+        with self._scrape_lock:
+            cached = self._scrape_cache.get(key)
+            if cached is not None:
+                self._scrape_cache.move_to_end(key)
+                return cached
+        result = sheet_row.original_scrape_katom(model_number, prefix)
+        # A stopped row returns a synthetic miss without fetching anything;
+        # memoizing it would poison this (model, prefix) pair for the rest
+        # of the session (mirrors the disk-cache guard in scrape_katom)
+        if not sheet_row.running:
+            return result
+        with self._scrape_lock:
+            self._scrape_cache[key] = result
+            if len(self._scrape_cache) > _SCRAPE_CACHE_MAX:
+                self._scrape_cache.popitem(last=False)
+        return result
+
+    def _executor(self):
+        """Get the shared thread pool for alternate-prefix scrapes"""
+        if self._pool is None:
+            self._pool = ThreadPoolExecutor(max_workers=_MAX_ALT_WORKERS, thread_name_prefix="mp-prefix")
+        return self._pool
+
+    def cleanup(self):
+        """Called by the plugin manager when the plugin is unloaded"""
+        if self._pool is not None:
+            self._pool.shutdown(wait=False)
+            self._pool = None
+
+    def _alt_prefixes(self, prefix):
+        """Get the alternate prefixes to try for a primary prefix (cached)"""
+        alts = self._alt_cache.get(prefix)
+        if alts is None:
+            alts = self._alt_cache.setdefault(prefix, tuple(p for p in self.prefixes if p != prefix))
+        return alts
+
+    def _is_miss(self, title):
+        """Check whether a scraped title means the item wasn't found"""
+        # Exact match first (no allocation), case-insensitive regex only on
+        # the slow path - avoids a .lower() copy of every successful title
+        return title is _MISS_EXACT or title == _MISS_EXACT or _MISS_RE.search(title) is not None
+
     def enhanced_scrape_katom(self, sheet_row, model_number, prefix):
         """Enhanced version of scrape_katom that tries multiple prefixes"""
         # First try with the original prefix
-        title, desc, specs_data, specs_html, video_links = sheet_row.original_scrape_katom(model_number, prefix)
-        
-        # If not found, try alternate prefixes
-        if title == "Title not found" or "not found" in title.lower():
-            sheet_row.signals.update_status.emit(f"Primary prefix failed, trying alternatives...")
-            
-            for alt_prefix in self.prefixes:
-                if alt_prefix != prefix:  # Skip the original prefix
-                    sheet_row.signals.update_status.emit(f"Trying prefix: {alt_prefix}")
-                    
-                    alt_title, alt_desc, alt_specs, alt_html, alt_video = sheet_row.original_scrape_katom(model_number, alt_prefix)
-                    
-                    if alt_title != "Title not found" and "not found" not in alt_title.lower():
-                        sheet_row.signals.update_status.emit(f"Found match with prefix: {alt_prefix}")
-                        return alt_title, alt_desc, alt_specs, alt_html, alt_video
-        
+        title, desc, specs_data, specs_html, video_links = self._cached_scrape(sheet_row, model_number, prefix)
+
+        # Found on the first try, or nothing else to fall back to - return
+        # without touching the executor or emitting any status
+        if not self._is_miss(title):
+            return title, desc, specs_data, specs_html, video_links
+        alts = self._alt_prefixes(prefix)
+        if not alts:
+            return title, desc, specs_data, specs_html, video_links
+
+        # Try all alternate prefixes concurrently and take the first hit -
+        # the calls are network-bound, so this turns the serial sum of
+        # round-trips into roughly the slowest single one. Status is
+        # coalesced into one emit per outcome - each emit is a cross-thread
+        # Qt signal, so per-prefix chatter adds up fast
+        futures = {
+            self._executor().submit(self._cached_scrape, sheet_row, model_number, alt_prefix): alt_prefix
+            for alt_prefix in alts
+        }
+        try:
+            for future in as_completed(futures):
+                alt_title, alt_desc, alt_specs, alt_html, alt_video = future.result()
+                if not self._is_miss(alt_title):
+                    sheet_row.signals.update_status.emit(
+                        f"Primary prefix failed | found match with prefix: {futures[future]}"
+                    )
+                    return alt_title, alt_desc, alt_specs, alt_html, alt_video
+            sheet_row.signals.update_status.emit(
+                f"Primary prefix failed | no match in {len(alts)} alternatives"
+            )
+        finally:
+            # Cancel anything still pending once we have an answer
+            for future in futures:
+                future.cancel()
+
         # Return original results (either successful or not)
         return title, desc, specs_data, specs_html, video_links
 
 
 class PrefixDialog(QDialog):
     """Dialog to manage multiple prefixes"""
-    
+
+    # The Qt base class still provides a __dict__, but slotted attributes get
+    # direct descriptor storage, which is what the hot handlers touch
+    __slots__ = (
+        'prefix_list', '_shadow', 'add_button', 'remove_button',
+        'up_button', 'down_button', 'ok_button', 'cancel_button',
+    )
+
     def __init__(self, prefixes, parent=None):
+        from PyQt5.QtWidgets import QVBoxLayout, QLabel, QHBoxLayout, QListWidget
+
         super().__init__(parent)
         self.setWindowTitle("Multi-Prefix Settings")
         self.resize(400, 300)
-        self.prefixes = prefixes.copy()
+        # The shadow list doubles as our own copy of the initial prefixes;
+        # no separate self.prefixes allocation needed
+        self._shadow = list(prefixes)
         
         # Main layout
         layout = QVBoxLayout(self)
@@ -128,13 +289,27 @@ class PrefixDialog(QDialog):
         label.setWordWrap(True)
         layout.addWidget(label)
         
-        # Add prefix list
+        # Add prefix list, populated with one batch call instead of one
+        # cross-binding addItem per prefix; suppress repaints and signals
+        # while filling so Qt does a single layout pass afterwards
         self.prefix_list = QListWidget()
-        for prefix in self.prefixes:
-            item = QListWidgetItem(prefix)
+        self.prefix_list.setUpdatesEnabled(False)
+        self.prefix_list.blockSignals(True)
+        self.prefix_list.addItems([str(prefix) for prefix in self._shadow])
+        for i in range(self.prefix_list.count()):
+            item = self.prefix_list.item(i)
             item.setFlags(item.flags() | Qt.ItemIsEditable)
-            self.prefix_list.addItem(item)
-            
+        self.prefix_list.blockSignals(False)
+        self.prefix_list.setUpdatesEnabled(True)
+
+        # Keep the shadow in sync with the widget via the model signals below
+        # so get_prefixes doesn't have to walk the widget item by item
+        model = self.prefix_list.model()
+        model.rowsInserted.connect(self._on_rows_inserted)
+        model.rowsRemoved.connect(self._on_rows_removed)
+        model.rowsMoved.connect(self._on_rows_moved)
+        self.prefix_list.itemChanged.connect(self._on_item_changed)
+
         layout.addWidget(self.prefix_list)
         
         # Add controls for prefix list
@@ -176,6 +351,8 @@ class PrefixDialog(QDialog):
     
     def add_prefix(self):
         """Add a new prefix to the list"""
+        from PyQt5.QtWidgets import QListWidgetItem
+
         item = QListWidgetItem("new")
         item.setFlags(item.flags() | Qt.ItemIsEditable)
         self.prefix_list.addItem(item)
@@ -206,9 +383,29 @@ class PrefixDialog(QDialog):
             self.prefix_list.insertItem(current_row + 1, item)
             self.prefix_list.setCurrentRow(current_row + 1)
     
+    def _on_rows_inserted(self, parent, first, last):
+        """Mirror newly inserted rows into the shadow list"""
+        for row in range(first, last + 1):
+            self._shadow.insert(row, self.prefix_list.item(row).text())
+
+    def _on_rows_removed(self, parent, first, last):
+        """Drop removed rows from the shadow list"""
+        del self._shadow[first:last + 1]
+
+    def _on_rows_moved(self, parent, start, end, dest, dest_row):
+        """Reorder the shadow list when rows are moved"""
+        moved = self._shadow[start:end + 1]
+        del self._shadow[start:end + 1]
+        if dest_row > start:
+            dest_row -= len(moved)
+        self._shadow[dest_row:dest_row] = moved
+
+    def _on_item_changed(self, item):
+        """Track edits to an item's text in the shadow list"""
+        row = self.prefix_list.row(item)
+        if 0 <= row < len(self._shadow):
+            self._shadow[row] = item.text()
+
     def get_prefixes(self):
         """Get the list of prefixes"""
-        prefixes = []
-        for i in range(self.prefix_list.count()):
-            prefixes.append(self.prefix_list.item(i).text())
-        return prefixes
+        return list(self._shadow)
@@ -1,19 +1,19 @@
 #!/usr/bin/env python3
 # Save this as excel_formatter.py
 
-import openpyxl
-from openpyxl.styles import Alignment, Font, PatternFill, Border, Side
-from openpyxl.utils import get_column_letter
 import os
-import pandas as pd
 import traceback
 
 class ExcelFormatter:
     """Helper class to enhance Excel output formatting"""
-    
+
     def __init__(self, config_manager=None):
+        # Deferred import so pulling in this module at startup doesn't pay
+        # the openpyxl import cost before any file is formatted
+        from openpyxl.styles import Alignment, Font, PatternFill, Border, Side
+
         self.config_manager = config_manager
-        
+
         # Default styling
         self.header_fill = PatternFill(start_color="4285F4", end_color="4285F4", fill_type="solid")
         self.header_font = Font(bold=True, color="FFFFFF")
@@ -42,6 +42,8 @@ class ExcelFormatter:
     def format_excel_file(self, filepath):
         """Apply enhanced formatting to an Excel file"""
         try:
+            import openpyxl
+
             if not os.path.exists(filepath):
                 print(f"File not found: {filepath}")
                 return False
@@ -81,37 +83,49 @@ class ExcelFormatter:
     
     def _format_data_rows(self, worksheet):
         """Format the data rows of the worksheet"""
+        from openpyxl.styles import Alignment, Font
+
+        # Resolve column names once - looking the header cell up per data
+        # cell costs a worksheet access for every cell in the sheet. The
+        # alignment/font objects are likewise shared, not built per cell.
+        column_names = {cell.column: cell.value for cell in worksheet[1]}
+        desc_alignment = Alignment(wrap_text=True, vertical="top")
+        title_alignment = Alignment(wrap_text=True)
+        center_alignment = Alignment(horizontal="center")
+        default_alignment = Alignment(vertical="center")
+        link_font = Font(color="0000FF", underline="single")
+
         for row_idx, row in enumerate(worksheet.iter_rows(min_row=2), 2):
             # Set default row height
             worksheet.row_dimensions[row_idx].height = self.default_row_height
-            
+
             for cell in row:
                 # Apply border to all cells
                 cell.border = self.border
-                
-                # Get column name
-                col_idx = cell.column
-                col_name = worksheet.cell(row=1, column=col_idx).value
-                
+
+                col_name = column_names.get(cell.column)
+
                 # Format based on column type
                 if col_name == "Description":
-                    cell.alignment = Alignment(wrap_text=True, vertical="top")
+                    cell.alignment = desc_alignment
                     # Set a taller row height for description rows
                     worksheet.row_dimensions[row_idx].height = self.description_row_height
                 elif col_name == "Title":
-                    cell.alignment = Alignment(wrap_text=True)
+                    cell.alignment = title_alignment
                 elif "Weight" in str(col_name):
-                    cell.alignment = Alignment(horizontal="center")
+                    cell.alignment = center_alignment
                 elif "Link" in str(col_name):
                     # Make hyperlinks blue and underlined
                     if cell.value:
-                        cell.font = Font(color="0000FF", underline="single")
+                        cell.font = link_font
                         cell.hyperlink = cell.value
                 else:
-                    cell.alignment = Alignment(vertical="center")
+                    cell.alignment = default_alignment
     
     def _adjust_column_widths(self, worksheet):
         """Adjust column widths based on content"""
+        from openpyxl.utils import get_column_letter
+
         column_names = {}
         
         # Map column indices to names
@@ -1,8 +1,6 @@
 #!/usr/bin/env python3
 import sys
 import os
-import pandas as pd
-import gspread
 import re
 import math
 from PyQt5.QtWidgets import (
@@ -11,19 +9,106 @@ from PyQt5.QtWidgets import (
 )
 from PyQt5.QtCore import Qt, QTimer, pyqtSignal, QObject
 from PyQt5.QtGui import QFont
-from oauth2client.service_account import ServiceAccountCredentials
 from selenium import webdriver
 from selenium.webdriver.chrome.options import Options
 from selenium.webdriver.common.by import By
-from selenium.webdriver.support.ui import WebDriverWait
-from selenium.webdriver.support import expected_conditions as EC
 from selenium.common.exceptions import NoSuchElementException, TimeoutException
 from fake_useragent import UserAgent
 import threading
 import time
 import traceback
-import openpyxl
-from openpyxl.styles import Alignment
+from concurrent.futures import ThreadPoolExecutor, as_completed
+
+# pandas and openpyxl together cost over a second of import time and are
+# not needed until a file is actually loaded or saved, so they are pulled
+# in lazily - the window appears as soon as Qt is up
+pd = None
+openpyxl = None
+WriteOnlyCell = None
+Alignment = None
+
+def _ensure_pandas():
+    """Import pandas on first use and publish it as the module-level pd"""
+    global pd
+    if pd is None:
+        import pandas
+        pd = pandas
+
+def _ensure_openpyxl():
+    """Import openpyxl and its helpers on first use"""
+    global openpyxl, WriteOnlyCell, Alignment
+    if openpyxl is None:
+        import openpyxl as _openpyxl
+        from openpyxl.cell import WriteOnlyCell as _write_only_cell
+        from openpyxl.styles import Alignment as _alignment
+        openpyxl = _openpyxl
+        WriteOnlyCell = _write_only_cell
+        Alignment = _alignment
+
+# openpyxl serializes much faster with lxml available - surface it at startup
+# rather than silently running the pure-Python path on big output sheets
+try:
+    import lxml
+except ImportError:
+    print("Warning: lxml is not installed; Excel writes will use openpyxl's slower pure-Python serializer")
+
+# Optional fast-path scraping stack: plain HTTP fetch + in-process HTML
+# parsing. Katom product pages are server-rendered, so most scrapes don't
+# need a browser at all; Selenium stays as the fallback for pages the fast
+# path can't handle (and for installs without these packages).
+try:
+    import httpx
+    from selectolax.parser import HTMLParser
+    HTTP_SCRAPE_AVAILABLE = True
+except ImportError:
+    httpx = None
+    HTMLParser = None
+    HTTP_SCRAPE_AVAILABLE = False
+
+# Optional on-disk scrape cache so re-running a file after a partial stop
+# doesn't re-fetch every URL. Hits live a week; 404s are retried sooner.
+try:
+    import diskcache
+    _SCRAPE_DISK_CACHE = diskcache.Cache(os.path.expanduser('~/.mk-processor-cache'))
+except Exception:
+    _SCRAPE_DISK_CACHE = None
+_SCRAPE_HIT_TTL = 7 * 86400
+_SCRAPE_MISS_TTL = 86400
+
+# Shared UserAgent instance - constructing one parses the fake_useragent data
+# file (or fetches it) every time, which is far too expensive per scrape
+_ua = None
+
+def _get_ua():
+    """Get the shared fake_useragent instance, building it on first use"""
+    global _ua
+    if _ua is None:
+        _ua = UserAgent()
+    return _ua
+
+# Shared HTTP client so concurrent scrapes reuse keep-alive connections.
+# The worker pool drives this client from many threads at once, so the
+# pool limits are what cap concurrent fetches against the site.
+_http_client = None
+_http_client_lock = threading.Lock()
+
+def get_http_client():
+    """Get the shared pooled HTTP client, creating it on first use"""
+    global _http_client
+    if _http_client is None:
+        with _http_client_lock:
+            if _http_client is None:
+                _http_client = httpx.Client(
+                    headers={'User-Agent': _get_ua().random},
+                    limits=httpx.Limits(
+                        max_connections=32,
+                        max_keepalive_connections=32,
+                        keepalive_expiry=300,
+                    ),
+                    timeout=15,
+                    follow_redirects=True,
+                )
+    return _http_client
 
 # Add these new imports for our extensions
 from config_manager import ConfigManager
@@ -33,6 +118,42 @@ from webscraper_wrapper import create_webscraper_wrapper
 from excel_formatter import enhance_save_results
 from plugin_manager_dialog import PluginManagerDialog
 
+# Patterns used in per-row/per-element loops, compiled once at import
+_NUM_RE = re.compile(r'(\d+(\.\d+)?)')
+_UNITS_RE = re.compile(r'[^\d.]+$')
+_PREFIX_RE = re.compile(r'[\w]+-(\d+)')
+_MP4_RE = re.compile(r'https?://[^"\']+\.mp4')
+_KV_PATTERNS = (re.compile(r'([^:]+):\s*(.+)'), re.compile(r'([^-]+)-\s*(.+)'))
+_NONALNUM_RE = re.compile(r'[^A-Za-z0-9]')
+
+# Output columns for scraped video links, built once rather than
+# re-formatting the f-string per link on the hot path
+_VIDEO_KEYS = tuple(f"Video Link {i}" for i in range(1, 6))
+
+# Spec names recognized by the key/value text fallback (Method 3); matched
+# as substrings of the lowercased key
+_COMMON_SPECS = (
+    "manufacturer", "food type", "frypot style", "heat", "hertz", "nema",
+    "number of", "oil capacity", "phase", "product", "type", "rating",
+    "special features", "voltage", "warranty", "weight", "dimensions"
+)
+
+# Recycle a reused Chrome driver after this many pages to bound memory growth
+_DRIVER_RECYCLE_USES = 50
+
+def wait_for_css(driver, selector, timeout=10, poll=0.05):
+    """Wait for a CSS selector to match, polling with a short interval.
+    WebDriverWait polls every 500ms by default; a 50ms script check shaves
+    most of that latency off every page."""
+    deadline = time.monotonic() + timeout
+    script = f'return !!document.querySelector({selector!r})'
+    while True:
+        if driver.execute_script(script):
+            return True
+        if time.monotonic() >= deadline:
+            return False
+        time.sleep(poll)
+
 # Simple class for better error handling
 class AppError(Exception):
     pass
@@ -44,6 +165,93 @@ class WorkerSignals(QObject):
     finished = pyqtSignal()
     error = pyqtSignal(str)
 
+# Row stylesheet, hoisted to module scope so Qt parses it once instead of
+# once per SheetRow created
+_ROW_STYLESHEET = """
+    QFrame {
+        background-color: white;
+        border-radius: 2px;
+        padding: 8px;
+        border: 1px solid #cccccc;
+    }
+    QProgressBar {
+        border: 1px solid #cccccc;
+        border-radius: 2px;
+        text-align: center;
+        height: 14px;
+        font-size: 9px;
+        margin-top: 0px;
+    }
+    QProgressBar::chunk {
+        background-color: #4285f4;
+        border-radius: 1px;
+    }
+    QComboBox {
+        border: 1px solid #aaaaaa;
+        border-radius: 2px;
+        padding: 3px;
+        background-color: white;
+        min-height: 24px;
+        max-height: 24px;
+        font-size: 11px;
+    }
+    QLineEdit {
+        border: 1px solid #aaaaaa;
+        border-radius: 2px;
+        padding: 3px;
+        background-color: white;
+        min-height: 24px;
+        max-height: 24px;
+        font-size: 11px;
+    }
+    QPushButton {
+        border-radius: 2px;
+        padding: 3px;
+        min-height: 24px;
+        max-height: 24px;
+        font-weight: bold;
+        font-size: 11px;
+    }
+    QPushButton#startBtn {
+        background-color: #4285f4;
+        color: white;
+        border: none;
+    }
+    QPushButton#startBtn:hover {
+        background-color: #3367d6;
+    }
+    QPushButton#startBtn:disabled {
+        background-color: #a5c2f5;
+    }
+    QPushButton#stopBtn {
+        background-color: #f0f0f0;
+        color: #333333;
+        border: 1px solid #cccccc;
+    }
+    QPushButton#stopBtn:hover {
+        background-color: #e0e0e0;
+    }
+    QPushButton#stopBtn:disabled {
+        color: #aaaaaa;
+        border: 1px solid #e0e0e0;
+    }
+    QPushButton#refreshBtn {
+        background-color: #f0f0f0;
+        color: #333333;
+        border: 1px solid #aaaaaa;
+        font-size: 13px;
+        min-width: 24px;
+        max-width: 24px;
+    }
+    QPushButton#refreshBtn:hover {
+        background-color: #e0e0e0;
+    }
+    QLabel {
+        color: #333333;
+        font-size: 11px;
+    }
+"""
+
 class SheetRow(QFrame):
     def __init__(self, index, parent):
         super().__init__(parent)
@@ -55,7 +263,21 @@ class SheetRow(QFrame):
         self.output_path = None
         self.selected_file = None
         self.worker_thread = None
+        self.executor = None  # Worker pool for scraping, created on demand
+        # Scraped rows accumulate here as plain dicts; save_results builds
+        # the DataFrame in one shot (appending per row copies everything)
+        self._pending_rows = []
+        self._columns = None
+        self._output_dir_ready = False
+        # Reusable Chrome drivers, one per worker thread (Selenium drivers
+        # are not thread-safe), plus a registry so they can all be shut down
+        self._driver_local = threading.local()
+        self._all_drivers = []
+        self._drivers_lock = threading.Lock()
         self.signals = WorkerSignals()
+        # Throttle state for progress/status emits (see _maybe_emit_progress)
+        self._last_pct = -1
+        self._last_status_emit = 0.0
         
         # Set up UI
         self.setup_ui()
@@ -72,90 +294,7 @@ class SheetRow(QFrame):
     def setup_ui(self):
         # Basic styling
         self.setFrameShape(QFrame.StyledPanel)
-        self.setStyleSheet("""
-            QFrame {
-                background-color: white;
-                border-radius: 2px;
-                padding: 8px;
-                border: 1px solid #cccccc;
-            }
-            QProgressBar {
-                border: 1px solid #cccccc;
-                border-radius: 2px;
-                text-align: center;
-                height: 14px;
-                font-size: 9px;
-                margin-top: 0px;
-            }
-            QProgressBar::chunk {
-                background-color: #4285f4;
-                border-radius: 1px;
-            }
-            QComboBox {
-                border: 1px solid #aaaaaa;
-                border-radius: 2px;
-                padding: 3px;
-                background-color: white;
-                min-height: 24px;
-                max-height: 24px;
-                font-size: 11px;
-            }
-            QLineEdit {
-                border: 1px solid #aaaaaa;
-                border-radius: 2px;
-                padding: 3px;
-                background-color: white;
-                min-height: 24px;
-                max-height: 24px;
-                font-size: 11px;
-            }
-            QPushButton {
-                border-radius: 2px;
-                padding: 3px;
-                min-height: 24px;
-                max-height: 24px;
-                font-weight: bold;
-                font-size: 11px;
-            }
-            QPushButton#startBtn {
-                background-color: #4285f4;
-                color: white;
-                border: none;
-            }
-            QPushButton#startBtn:hover {
-                background-color: #3367d6;
-            }
-            QPushButton#startBtn:disabled {
-                background-color: #a5c2f5;
-            }
-            QPushButton#stopBtn {
-                background-color: #f0f0f0;
-                color: #333333;
-                border: 1px solid #cccccc;
-            }
-            QPushButton#stopBtn:hover {
-                background-color: #e0e0e0;
-            }
-            QPushButton#stopBtn:disabled {
-                color: #aaaaaa;
-                border: 1px solid #e0e0e0;
-            }
-            QPushButton#refreshBtn {
-                background-color: #f0f0f0;
-                color: #333333;
-                border: 1px solid #aaaaaa;
-                font-size: 13px;
-                min-width: 24px;
-                max-width: 24px;
-            }
-            QPushButton#refreshBtn:hover {
-                background-color: #e0e0e0;
-            }
-            QLabel {
-                color: #333333;
-                font-size: 11px;
-            }
-        """)
+        self.setStyleSheet(_ROW_STYLESHEET)
         
         # Set object name for debugging
         self.setObjectName(f"SheetRow_{self.index}")
@@ -259,6 +398,7 @@ class SheetRow(QFrame):
     def on_processing_finished(self):
         self.running = False
         self.completed = True
+        self._shutdown_drivers()
         self.start_btn.setEnabled(True)
         self.stop_btn.setEnabled(False)
         self.status_label.setText("Completed")
@@ -286,57 +426,91 @@ class SheetRow(QFrame):
         self.file_dropdown.setEnabled(not locked)
         self.prefix_input.setEnabled(not locked)
         self.refresh_btn.setEnabled(not locked)
+
+    def reset_state(self):
+        """Return this row to its freshly constructed state so the parent
+        can reuse it from its row pool instead of rebuilding the widgets"""
+        self._shutdown_drivers()
+        self.running = False
+        self.completed = False
+        self.output_df = None
+        self.output_path = None
+        self.selected_file = None
+        self.worker_thread = None
+        # A finished run keeps its executor for reuse; a pooled row must
+        # not, or every run/clear cycle leaks max_workers idle threads
+        if self.executor is not None:
+            self.executor.shutdown(wait=False)
+            self.executor = None
+        self._pending_rows = []
+        self._columns = None
+        self._output_dir_ready = False
+        self._driver_local = threading.local()
+        self._all_drivers = []
+        self._last_pct = -1
+        self._last_status_emit = 0.0
+
+        # Reset the widgets without firing selection handlers
+        self.file_dropdown.blockSignals(True)
+        self.file_dropdown.clear()
+        self.file_dropdown.addItem("")
+        self.file_dropdown.blockSignals(False)
+        self.prefix_input.clear()
+        self.start_btn.setEnabled(True)
+        self.stop_btn.setEnabled(False)
+        self.progress_bar.setValue(0)
+        self.status_label.setText("Ready")
+        self.lock_controls(False)
     
-    def load_files(self):
-        """Load files from Google Drive's Web folder, excluding files already selected in other rows"""
-        # Disconnect signal temporarily to prevent recursive calls
-        try:
-            self.file_dropdown.currentIndexChanged.disconnect(self.file_selected)
-        except:
-            pass  # Signal wasn't connected
-            
+    def load_files(self, all_files=None):
+        """Load files from Google Drive's Web folder, excluding files already
+        selected in other rows. A caller that has already listed the folder
+        can pass the listing in to skip the re-scan."""
+        # Block signals while repopulating to prevent recursive calls
+        self.file_dropdown.blockSignals(True)
+
         # Save current selection
         current_selection = self.file_dropdown.currentText()
-        
-        # Clear dropdown and add empty item first
-        self.file_dropdown.clear()
-        self.file_dropdown.addItem("")
+
         self.status_label.setText("Loading files...")
-        
+
         try:
-            # Get files from Google Drive Web folder
-            all_files = self.parent.get_drive_web_files()
-            
+            # Get files from Google Drive Web folder unless the caller
+            # supplied a listing ('not' also covers the checked=False bool
+            # the refresh button's clicked signal passes)
+            if not all_files:
+                all_files = self.parent.get_drive_web_files()
+
             # Get files that are already selected in other rows
             selected_files = self.parent.get_selected_files()
-            
+
             # Filter out already selected files (except current selection)
             available_files = []
             for file_name in all_files:
                 if file_name not in selected_files or file_name == current_selection:
                     available_files.append(file_name)
-            
-            # Add available files to dropdown
-            for file_name in available_files:
-                self.file_dropdown.addItem(file_name)
-            
+
+            # Repopulate in one batch - one model reset instead of one
+            # insertion event per file
+            self.file_dropdown.clear()
+            self.file_dropdown.addItems([""] + available_files)
+
             if len(available_files) == 0:
                 self.status_label.setText("No files available")
             else:
                 self.status_label.setText(f"Found {len(available_files)} files")
-            
+
             # Restore previous selection if available
             if current_selection:
                 index = self.file_dropdown.findText(current_selection)
                 if index >= 0:
                     self.file_dropdown.setCurrentIndex(index)
-                
+
         except Exception as e:
             print(f"Error loading files: {e}")
             self.status_label.setText("Error loading files")
-        
-        # Reconnect signal
-        self.file_dropdown.currentIndexChanged.connect(self.file_selected)
+        finally:
+            self.file_dropdown.blockSignals(False)
     
     def file_selected(self):
         """Handle file selection change event"""
@@ -350,14 +524,16 @@ class SheetRow(QFrame):
         else:
             self.selected_file = None
         
-        # Update other rows' available files - with safety check
+        # Update other rows' available files - with safety check. List the
+        # folder once and share it so K rows don't trigger K re-scans.
         try:
+            all_files = self.parent.get_drive_web_files()
             for i in range(self.parent.scroll_layout.count()):
                 item = self.parent.scroll_layout.itemAt(i)
                 if item:
                     row = item.widget()
                     if row and row != self and not row.running:
-                        row.load_files()
+                        row.load_files(all_files)
         except Exception as e:
             print(f"Error updating other rows: {e}")
             # Don't crash the application if update fails
@@ -365,7 +541,7 @@ class SheetRow(QFrame):
     def extract_prefix_from_filename(self, filename):
         """Extract prefix from filename (e.g., Globe-605 -> 605)"""
         # Look for pattern like "Globe-605" and extract "605"
-        match = re.search(r'[\w]+-(\d+)', filename)
+        match = _PREFIX_RE.search(filename)
         if match:
             prefix = match.group(1)
             self.prefix_input.setText(prefix)
@@ -415,22 +591,37 @@ class SheetRow(QFrame):
         self.start_btn.setEnabled(True)
         self.stop_btn.setEnabled(False)
         self.status_label.setText("Stopped")
+
+        # Drop any scrapes that haven't started yet
+        if self.executor is not None:
+            self.executor.shutdown(wait=False, cancel_futures=True)
+            self.executor = None
+        self._shutdown_drivers()
     
-    def reset_state(self):
-        """Reset the row state completely for reuse"""
-        self.running = False
-        self.completed = False
-        self.progress_bar.setValue(0)
-        self.status_label.setText("Ready")
-        self.start_btn.setEnabled(True)
-        self.stop_btn.setEnabled(False)
-    
+    def _maybe_emit_progress(self, current, total):
+        """Emit progress only when the integer percent moves (1%
+        granularity) or on completion - every emit crosses the thread
+        boundary and schedules a repaint, which floods the GUI thread on
+        fast runs. Re-emitting an unchanged percent repaints the same
+        pixels, so there is no time-based fallback."""
+        pct = int((current / total) * 100) if total > 0 else 0
+        if current >= total or pct != self._last_pct:
+            self._last_pct = pct
+            self.signals.update_progress.emit(current, total)
+
+    def _maybe_emit_status(self, status_text):
+        """Emit a status update at most every 100ms"""
+        now = time.monotonic()
+        if now - self._last_status_emit > 0.1:
+            self._last_status_emit = now
+            self.signals.update_status.emit(status_text)
+
     def process_weight_value(self, value):
         """Process weight values: round up to whole number and add 5"""
         try:
             # Try to extract a number from the string
             # This handles cases like "22.93" or "22.93 lbs"
-            number_match = re.search(r'(\d+(\.\d+)?)', str(value))
+            number_match = _NUM_RE.search(str(value))
             if number_match:
                 # Extract the number
                 number = float(number_match.group(1))
@@ -442,7 +633,7 @@ class SheetRow(QFrame):
                 final = rounded + 5
                 
                 # If the original had units, keep them
-                units_match = re.search(r'[^\d.]+$', str(value))
+                units_match = _UNITS_RE.search(str(value))
                 units = units_match.group(0).strip() if units_match else ""
                 
                 return f"{final}{' ' + units if units else ''}"
@@ -458,10 +649,19 @@ class SheetRow(QFrame):
         """
         specs_dict = {}
         specs_html = ""
-        
+
+        # When the in-process parser is available, fetch the page source once
+        # and parse it locally - every find_elements/.text call below is a
+        # devtools round-trip, one per row, cell and candidate element
+        if HTTP_SCRAPE_AVAILABLE:
+            try:
+                return self.extract_table_data_from_tree(HTMLParser(driver.page_source))
+            except Exception as e:
+                print(f"Error parsing page source, falling back to DOM walk: {e}")
+
         try:
             # Try multiple approaches to find the table
-            
+
             # First, try to get the original table HTML
             specs_tables = driver.find_elements(By.CSS_SELECTOR, "table.table.table-condensed.specs-table")
             
@@ -474,27 +674,29 @@ class SheetRow(QFrame):
                 table = specs_tables[0]
                 rows = table.find_elements(By.TAG_NAME, "tr")
                 
-                # Build a clean table with slim styling
-                specs_html = '<table class="specs-table" cellspacing="0" cellpadding="4" border="1" style="margin-top:10px;border-collapse:collapse;width:auto;" align="left"><tbody>'
-                
+                # Build a clean table with slim styling, joining the row
+                # markup once instead of reallocating the string per row
+                parts = ['<table class="specs-table" cellspacing="0" cellpadding="4" border="1" style="margin-top:10px;border-collapse:collapse;width:auto;" align="left"><tbody>']
+
                 for row in rows:
                     cells = row.find_elements(By.TAG_NAME, "td")
                     if len(cells) >= 2:
                         key = cells[0].text.strip()
                         value = cells[1].text.strip()
-                        
+
                         # Check if this is a weight field and process accordingly
                         if "weight" in key.lower():
                             value = self.process_weight_value(value)
-                        
+
                         # Add to the dictionary
                         if key and not key.lower() in specs_dict:
                             specs_dict[key.lower()] = value
-                        
+
                         # Add to the HTML table
-                        specs_html += f'<tr><td style="padding:3px 8px;"><b>{key}</b></td><td style="padding:3px 8px;">{value}</td></tr>'
-                
-                specs_html += "</tbody></table>"
+                        parts.append(f'<tr><td style="padding:3px 8px;"><b>{key}</b></td><td style="padding:3px 8px;">{value}</td></tr>')
+
+                parts.append("</tbody></table>")
+                specs_html = ''.join(parts)
             
             # If no table found or no HTML extracted, create an HTML table from the data we find
             if not specs_html or specs_html == "":
@@ -543,47 +745,45 @@ class SheetRow(QFrame):
                                 if not key.lower() in specs_dict:
                                     specs_dict[key.lower()] = value
                 
-                # Method 3: Look for text patterns in all content
+                # Method 3: Look for text patterns in likely spec nodes
                 if not other_specs:
-                    # Get all elements that might contain specs
-                    elements = driver.find_elements(By.CSS_SELECTOR, "p, div, li, span")
-                    
-                    # Common spec terms to look for - expand this list as needed
-                    common_specs = [
-                        "manufacturer", "food type", "frypot style", "heat", "hertz", "nema", 
-                        "number of", "oil capacity", "phase", "product", "type", "rating", 
-                        "special features", "voltage", "warranty", "weight", "dimensions"
-                    ]
-                    
+                    # Restrict the candidate set - each .text call is a
+                    # devtools round trip
+                    elements = driver.find_elements(By.CSS_SELECTOR, "p, li, div.spec, span.spec")
+
                     for element in elements:
                         text = element.text.strip()
                         if not text or len(text) > 100:  # Skip empty or very long text
                             continue
-                        
+                        if ":" not in text and "-" not in text:
+                            continue  # No separator, no key/value pair
+
                         # Look for patterns like "Key: Value" or "Key - Value"
-                        for pattern in [r'([^:]+):\s*(.+)', r'([^-]+)-\s*(.+)']: 
-                            match = re.match(pattern, text)
+                        for pattern in _KV_PATTERNS:
+                            match = pattern.match(text)
                             if match:
                                 key = match.group(1).strip()
                                 value = match.group(2).strip()
-                                
+                                key_lower = key.lower()
+
                                 # Check if this is a weight field and process accordingly
-                                if "weight" in key.lower():
+                                if "weight" in key_lower:
                                     value = self.process_weight_value(value)
-                                
+
                                 # Check if this key is one of our common specs
-                                if any(spec in key.lower() for spec in common_specs):
+                                if any(spec in key_lower for spec in _COMMON_SPECS):
                                     other_specs.append((key, value))
-                                    if not key.lower() in specs_dict:
-                                        specs_dict[key.lower()] = value
+                                    if key_lower not in specs_dict:
+                                        specs_dict[key_lower] = value
                                     break
                 
                 # Create HTML table from the data we collected
                 if other_specs:
-                    specs_html = '<table class="specs-table" cellspacing="0" cellpadding="4" border="1" style="margin-top:10px;border-collapse:collapse;width:auto;" align="left"><tbody>'
+                    parts = ['<table class="specs-table" cellspacing="0" cellpadding="4" border="1" style="margin-top:10px;border-collapse:collapse;width:auto;" align="left"><tbody>']
                     for key, value in other_specs:
-                        specs_html += f'<tr><td style="padding:3px 8px;"><b>{key}</b></td><td style="padding:3px 8px;">{value}</td></tr>'
-                    specs_html += "</tbody></table>"
+                        parts.append(f'<tr><td style="padding:3px 8px;"><b>{key}</b></td><td style="padding:3px 8px;">{value}</td></tr>')
+                    parts.append("</tbody></table>")
+                    specs_html = ''.join(parts)
         
         except Exception as e:
             print(f"Error extracting table data: {e}")
@@ -592,44 +792,341 @@ class SheetRow(QFrame):
     
     def scrape_katom(self, model_number, prefix):
         """Scrape product info from Katom website"""
-        # Clean model number
-        model_number = ''.join(e for e in model_number if e.isalnum()).upper()
+        # A stopped run's in-flight scrapes return the miss shape straight
+        # away (and never cache it) - no point fetching for abandoned rows
+        if not self.running:
+            return "Title not found", "Description not found", {}, "", ""
+
+        # Clean model number (regex sub beats a per-character Python loop)
+        model_number = _NONALNUM_RE.sub('', model_number).upper()
         if model_number.endswith("HC"):
             model_number = model_number[:-2]
-        
+
         url = f"https://www.katom.com/{prefix}-{model_number}.html"
-        
-        # Set up Selenium
-        options = Options()
-        options.add_argument('--headless')
-        options.add_argument('--no-sandbox')
-        options.add_argument('--disable-dev-shm-usage')
-        options.add_argument(f'user-agent={UserAgent().random}')
-        
-        driver = None
+
+        # Check the on-disk cache first - re-runs of the same file become
+        # disk-only instead of re-scraping every URL
+        cache_key = f"{prefix}:{model_number}"
+        if _SCRAPE_DISK_CACHE is not None:
+            try:
+                cached = _SCRAPE_DISK_CACHE.get(cache_key)
+            except Exception:
+                cached = None
+            if cached is not None:
+                return cached
+
+        # Fast path: plain HTTP fetch + in-process parse. Falls through to
+        # Selenium when the stack isn't installed or the page needs JS.
+        result = None
+        if HTTP_SCRAPE_AVAILABLE:
+            result = self.scrape_katom_http(url)
+        if result is None:
+            # Re-check before the slow path: a stop during the HTTP
+            # attempt must not escalate the row to a Chrome navigation
+            if not self.running:
+                return "Title not found", "Description not found", {}, "", ""
+            result = self.scrape_katom_selenium(url)
+
+        if _SCRAPE_DISK_CACHE is not None:
+            expire = _SCRAPE_MISS_TTL if "not found" in result[0].lower() else _SCRAPE_HIT_TTL
+            try:
+                _SCRAPE_DISK_CACHE.set(cache_key, result, expire=expire)
+            except Exception as e:
+                print(f"Error writing scrape cache: {e}")
+
+        return result
+
+    def scrape_katom_http(self, url):
+        """Scrape a product page over plain HTTP, avoiding Chrome startup.
+        Returns the usual result tuple, or None if the page needs the
+        Selenium fallback."""
+        # Retry transient failures with exponential back-off so a brief
+        # stumble (or a 429 from scraping one host hard) doesn't dump the
+        # whole batch onto the Selenium path
+        response = None
+        for attempt in range(3):
+            if not self.running:
+                break  # Stop retrying; the caller checks running again
+            try:
+                response = get_http_client().get(url)
+            except Exception as e:
+                print(f"HTTP fetch failed for {url}: {e}")
+                response = None
+            if response is not None and response.status_code not in (429, 500, 502, 503, 504):
+                break
+            if attempt < 2:  # No point sleeping after the last attempt
+                time.sleep(0.5 * (2 ** attempt))
+        if response is None:
+            return None
+
+        if response.status_code == 404:
+            # Definitive miss - same shape the Selenium path returns
+            return "Title not found", "Description not found", {}, "", ""
+        if response.status_code != 200:
+            return None
+
+        tree = HTMLParser(response.text)
+
+        title_node = tree.css_first("h1.product-name.mb-0")
+        if title_node is None:
+            # Possibly JS-gated; let Selenium have a go
+            return None
+        title = title_node.text(strip=True)
+        if not title:
+            return None
+
+        # Get description
+        description = "Description not found"
+        tab_content = tree.css_first(".tab-content")
+        if tab_content is not None:
+            filtered = []
+            for p in tab_content.css("p"):
+                text = p.text(deep=True, strip=True)
+                if text and not text.lower().startswith("*free") and "video" not in text.lower():
+                    filtered.append(f"<p>{text}</p>")
+            if filtered:
+                description = "".join(filtered)
+
+        specs_data, specs_html = self.extract_table_data_from_tree(tree)
+        video_links = self.extract_video_links_from_html(response.text, tree)
+
+        return title, description, specs_data, specs_html, video_links
+
+    def extract_table_data_from_tree(self, tree):
+        """
+        Extract table data from a parsed HTML tree (fast path counterpart of
+        extract_table_data). Returns a tuple: (specs_dict, specs_html)
+        """
+        specs_dict = {}
+        specs_html = ""
+
+        try:
+            specs_table = tree.css_first("table.table.table-condensed.specs-table") or tree.css_first("table")
+
+            if specs_table is not None:
+                # Accumulate row markup in a list and join once - += on a
+                # growing string reallocates the whole buffer every row
+                parts = ['<table class="specs-table" cellspacing="0" cellpadding="4" border="1" style="margin-top:10px;border-collapse:collapse;width:auto;" align="left"><tbody>']
+
+                for row in specs_table.css("tr"):
+                    cells = row.css("td")
+                    if len(cells) >= 2:
+                        key = cells[0].text(deep=True, strip=True)
+                        value = cells[1].text(deep=True, strip=True)
+
+                        # Check if this is a weight field and process accordingly
+                        if "weight" in key.lower():
+                            value = self.process_weight_value(value)
+
+                        # Add to the dictionary
+                        if key and not key.lower() in specs_dict:
+                            specs_dict[key.lower()] = value
+
+                        # Add to the HTML table
+                        parts.append(f'<tr><td style="padding:3px 8px;"><b>{key}</b></td><td style="padding:3px 8px;">{value}</td></tr>')
+
+                parts.append("</tbody></table>")
+                specs_html = ''.join(parts)
+
+            # If no table found or no HTML extracted, mirror the Selenium
+            # fallbacks: dedicated spec elements, definition lists, then
+            # key/value text patterns
+            if not specs_html or specs_html == "":
+                other_specs = []
+
+                # Method 1: Look for dedicated spec elements
+                for row in tree.css('.specs-row, [class*="spec"]'):
+                    key_elem = row.css_first('.spec-key, .spec-name, [class*="key"], [class*="name"]')
+                    val_elem = row.css_first('.spec-value, .spec-val, [class*="value"], [class*="val"]')
+
+                    if key_elem is not None and val_elem is not None:
+                        key = key_elem.text(deep=True, strip=True)
+                        value = val_elem.text(deep=True, strip=True)
+
+                        if "weight" in key.lower():
+                            value = self.process_weight_value(value)
+
+                        if key:
+                            other_specs.append((key, value))
+                            if not key.lower() in specs_dict:
+                                specs_dict[key.lower()] = value
+
+                # Method 2: Look for definition lists
+                if not other_specs:
+                    for dl in tree.css("dl"):
+                        terms = dl.css("dt")
+                        definitions = dl.css("dd")
+
+                        for i in range(min(len(terms), len(definitions))):
+                            key = terms[i].text(deep=True, strip=True)
+                            value = definitions[i].text(deep=True, strip=True)
+
+                            if "weight" in key.lower():
+                                value = self.process_weight_value(value)
+
+                            if key:
+                                other_specs.append((key, value))
+                                if not key.lower() in specs_dict:
+                                    specs_dict[key.lower()] = value
+
+                # Method 3: Look for text patterns in likely spec nodes.
+                # 'p, div, li, span' matched thousands of nodes on a full
+                # product page; restrict the candidates and reject text
+                # without a key/value separator before running the regexes.
+                if not other_specs:
+                    for element in tree.css("p, li, div.spec, span.spec"):
+                        text = element.text(deep=True, strip=True)
+                        if not text or len(text) > 100:  # Skip empty or very long text
+                            continue
+                        if ":" not in text and "-" not in text:
+                            continue  # No separator, no key/value pair
+
+                        for pattern in _KV_PATTERNS:
+                            match = pattern.match(text)
+                            if match:
+                                key = match.group(1).strip()
+                                value = match.group(2).strip()
+                                key_lower = key.lower()
+
+                                if "weight" in key_lower:
+                                    value = self.process_weight_value(value)
+
+                                if any(spec in key_lower for spec in _COMMON_SPECS):
+                                    other_specs.append((key, value))
+                                    if key_lower not in specs_dict:
+                                        specs_dict[key_lower] = value
+                                    break
+
+                if other_specs:
+                    parts = ['<table class="specs-table" cellspacing="0" cellpadding="4" border="1" style="margin-top:10px;border-collapse:collapse;width:auto;" align="left"><tbody>']
+                    for key, value in other_specs:
+                        parts.append(f'<tr><td style="padding:3px 8px;"><b>{key}</b></td><td style="padding:3px 8px;">{value}</td></tr>')
+                    parts.append("</tbody></table>")
+                    specs_html = ''.join(parts)
+
+        except Exception as e:
+            print(f"Error extracting table data from tree: {e}")
+
+        return specs_dict, specs_html
+
+    def extract_video_links_from_html(self, page_source, tree):
+        """Extract .mp4 video links from already-fetched page HTML"""
+        # Set-based dedup - substring checks against a growing string are
+        # quadratic on pages with long source lists
+        links = []
+        seen = set()
+
+        try:
+            # One pass over the tree plus the raw-source regex, unioned
+            for source in tree.css("source[src*='.mp4'], source[type*='video'], video source"):
+                src = source.attributes.get("src")
+                if src and src not in seen:
+                    seen.add(src)
+                    links.append(src)
+
+            for match in _MP4_RE.findall(page_source):
+                if match not in seen:
+                    seen.add(match)
+                    links.append(match)
+        except Exception as e:
+            print(f"Error extracting video links: {e}")
+
+        return "\n".join(links) + ("\n" if links else "")
+
+    def _get_driver(self):
+        """Get this thread's reusable Chrome driver, recycling it periodically"""
+        local = self._driver_local
+        driver = getattr(local, 'driver', None)
+        if driver is not None and local.uses >= _DRIVER_RECYCLE_USES:
+            self._discard_driver()
+            driver = None
+
+        if driver is None:
+            options = Options()
+            options.add_argument('--headless')
+            options.add_argument('--no-sandbox')
+            options.add_argument('--disable-dev-shm-usage')
+            options.add_argument(f'user-agent={_get_ua().random}')
+            # Return from driver.get on DOMContentLoaded instead of full load,
+            # and skip downloading resources we never read
+            options.page_load_strategy = 'eager'
+            options.add_argument('--blink-settings=imagesEnabled=false')
+            options.add_experimental_option('prefs', {
+                'profile.managed_default_content_settings.images': 2,
+                'profile.managed_default_content_settings.stylesheets': 2,
+                'profile.managed_default_content_settings.fonts': 2,
+            })
+
+            driver = webdriver.Chrome(options=options)
+            driver.set_page_load_timeout(30)  # Set timeout to prevent hanging
+            local.driver = driver
+            local.uses = 0
+            with self._drivers_lock:
+                self._all_drivers.append(driver)
+
+        local.uses += 1
+        return driver
+
+    def _discard_driver(self):
+        """Quit and forget the current thread's driver"""
+        local = self._driver_local
+        driver = getattr(local, 'driver', None)
+        if driver is None:
+            return
+        local.driver = None
+        local.uses = 0
+        with self._drivers_lock:
+            if driver in self._all_drivers:
+                self._all_drivers.remove(driver)
+        try:
+            driver.quit()
+        except:
+            pass
+
+    def _shutdown_drivers(self):
+        """Quit every pooled driver once processing ends"""
+        with self._drivers_lock:
+            drivers, self._all_drivers = self._all_drivers, []
+        for driver in drivers:
+            try:
+                driver.quit()
+            except:
+                pass
+
+    def scrape_katom_selenium(self, url):
+        """Scrape a product page with headless Chrome (fallback path)"""
         title, description = "Title not found", "Description not found"
         specs_data = {}  # Dictionary to hold spec data
         specs_html = ""  # HTML table for other specs
         video_links = ""  # String to store video links
         item_found = False
-        
+
+        # Cheap HEAD probe before touching Chrome: a dead SKU otherwise
+        # costs a full navigation plus a 10s wait for a title element that
+        # never appears
+        if HTTP_SCRAPE_AVAILABLE:
+            try:
+                resp = get_http_client().head(url, timeout=5)
+                if resp.status_code == 404:
+                    return title, description, specs_data, specs_html, video_links
+            except Exception:
+                pass  # Probe is best-effort; fall through to Selenium
+
         try:
-            driver = webdriver.Chrome(options=options)
-            driver.set_page_load_timeout(30)  # Set timeout to prevent hanging
+            # Chrome startup dominates per-page cost, so reuse this thread's
+            # driver across calls instead of launching one per scrape
+            driver = self._get_driver()
             driver.get(url)
-            
+
             # Check for 404
             if "404" in driver.title or "not found" in driver.title.lower():
-                if driver:
-                    driver.quit()
                 return title, description, specs_data, specs_html, video_links
-            
+
             # Get title
             try:
-                WebDriverWait(driver, 10).until(
-                    EC.presence_of_element_located((By.CSS_SELECTOR, "h1.product-name.mb-0"))
-                )
-                
+                if not wait_for_css(driver, "h1.product-name.mb-0", timeout=10):
+                    raise TimeoutException("title element did not appear")
+
                 title_element = driver.find_element(By.CSS_SELECTOR, "h1.product-name.mb-0")
                 title = title_element.text.strip()
                 if title:
@@ -658,57 +1155,67 @@ class SheetRow(QFrame):
                     print(f"Error getting description: {e}")
                     pass
                 
+                if HTTP_SCRAPE_AVAILABLE:
+                    # Pull the page source once and parse specs and video
+                    # links from the same tree - no further devtools calls
+                    page_source = driver.page_source
+                    tree = HTMLParser(page_source)
+                    specs_data, specs_html = self.extract_table_data_from_tree(tree)
+                    video_links = self.extract_video_links_from_html(page_source, tree)
+                    return title, description, specs_data, specs_html, video_links
+
                 # Extract table data as a dictionary AND get HTML table for other specs
                 specs_data, specs_html = self.extract_table_data(driver)
-                
+
                 # Extract video links - looking specifically for .mp4 sources
+                links = []
+                seen = set()
                 try:
                     # Find source tags with .mp4 files
                     sources = driver.find_elements(By.CSS_SELECTOR, "source[src*='.mp4'], source[type*='video']")
                     for source in sources:
                         src = source.get_attribute("src")
-                        if src and src not in video_links:
-                            video_links += f"{src}\n"
-                    
+                        if src and src not in seen:
+                            seen.add(src)
+                            links.append(src)
+
                     # If no video sources found, look for video elements
-                    if not video_links:
+                    if not links:
                         videos = driver.find_elements(By.TAG_NAME, "video")
                         for video in videos:
                             # Try to get source elements within video tag
                             inner_sources = video.find_elements(By.TAG_NAME, "source")
                             for source in inner_sources:
                                 src = source.get_attribute("src")
-                                if src and src not in video_links:
-                                    video_links += f"{src}\n"
-                                    
+                                if src and src not in seen:
+                                    seen.add(src)
+                                    links.append(src)
+
                     # Last resort - extract video URLs from the page source
-                    if not video_links:
+                    if not links:
                         page_source = driver.page_source
                         # Look for .mp4 URLs in the source
-                        mp4_pattern = r'https?://[^"\']+\.mp4'
-                        matches = re.findall(mp4_pattern, page_source)
-                        for match in matches:
-                            if match not in video_links:
-                                video_links += f"{match}\n"
+                        for match in _MP4_RE.findall(page_source):
+                            if match not in seen:
+                                seen.add(match)
+                                links.append(match)
                 except Exception as e:
                     print(f"Error extracting video links: {e}")
+                video_links = "\n".join(links) + ("\n" if links else "")
                     
         except Exception as e:
             print(f"Error in scrape_katom: {e}")
             print(traceback.format_exc())
-        finally:
-            # Ensure driver is always closed, even if an exception occurs
-            if driver:
-                try:
-                    driver.quit()
-                except:
-                    pass
-        
+            # A wedged Chrome shouldn't poison later scrapes on this thread
+            self._discard_driver()
+
         return title, description, specs_data, specs_html, video_links
 
     def process_file(self):
         """Process the file in a separate thread"""
         try:
+            _ensure_pandas()
+
             # Get selected file and prefix
             file_info = self.get_selected_file()
             if not file_info:
@@ -716,9 +1223,13 @@ class SheetRow(QFrame):
                 return
             
             prefix = self.prefix_input.text().strip()
-            
+
+            # hasattr is a try/except under the hood - resolve it once up
+            # front rather than at each hook site
+            has_plugins = hasattr(self.parent, 'plugin_manager')
+
             # Plugin hook: before_process_file
-            if hasattr(self.parent, 'plugin_manager'):
+            if has_plugins:
                 hook_results = self.parent.plugin_manager.execute_hook('before_process_file', self, file_info)
                 # Check if any plugin returned False to abort processing
                 if hook_results and any(result is False for result in hook_results.values()):
@@ -728,21 +1239,22 @@ class SheetRow(QFrame):
             # Load data from file
             df = self.load_file_data(file_info)
             
-            # Find the 'Mfr Model' column
-            model_col = None
-            for col in df.columns:
-                if isinstance(col, str) and col.strip().lower() == 'mfr model':
-                    model_col = col
-                    break
-            
+            # Normalize the header once; any required column is then a
+            # single dict lookup away (str() also covers non-string headers)
+            norm_cols = {str(col).strip().lower(): col for col in df.columns}
+            model_col = norm_cols.get('mfr model')
+
             if not model_col:
                 self.signals.error.emit("Missing 'Mfr Model' column in file")
                 return
             
+            # One attribute read instead of config traversals per value
+            cfg = getattr(self.parent, '_cfg', None)
+
             # Define common specification fields we want to extract as individual columns
             # Get from config if available
-            if hasattr(self.parent, 'config_manager'):
-                common_spec_fields = self.parent.config_manager.get("common_spec_fields")
+            if cfg is not None:
+                common_spec_fields = cfg["common_spec_fields"]
             else:
                 common_spec_fields = [
                     "manufacturer", "food type", "frypot style", "heat", "hertz", "nema", 
@@ -751,62 +1263,98 @@ class SheetRow(QFrame):
                     "warranty", "weight"
                 ]
             
+            # Precompute the spec-field lookup tables once; the per-row
+            # matching below would otherwise re-lower/title-case every
+            # field for every spec key of every scraped row
+            field_title_map = {field.lower(): field.title() for field in common_spec_fields}
+            field_lower_list = list(field_title_map)
+            spec_titles = list(field_title_map.values())
+
             # Set up output with base columns plus spec fields
             columns = ["Mfr Model", "Title", "Description"]
-            for field in common_spec_fields:
-                columns.append(field.title())  # Title case the field names for Excel
+            columns.extend(spec_titles)  # Title case the field names for Excel
             
             # Add multiple video link columns (up to 5)
-            for i in range(1, 6):  # Video Link 1, Video Link 2, etc.
-                columns.append(f"Video Link {i}")
+            columns.extend(_VIDEO_KEYS)
+
+            # Prebuilt row shape, already at its final size - each scraped
+            # row copies it and overwrites just the fields it computed
+            row_template = {col: "" for col in columns}
             
-            # Initialize output DataFrame with all columns
-            self.output_df = pd.DataFrame(columns=columns)
+            # Rows accumulate as dicts; the DataFrame is built at save time
+            self._columns = columns
+            self._pending_rows = []
+            self.output_df = None
             
             # Set output path from config if available
-            if hasattr(self.parent, 'config_manager'):
-                output_dir = os.path.expanduser(self.parent.config_manager.get("output", "output_dir"))
-                prefix = self.parent.config_manager.get("output", "prefix")
-                
+            if cfg is not None:
                 # Create the output path
-                filename = f"{prefix}{file_info['name']}.xlsx"
-                self.output_path = os.path.join(output_dir, filename)
+                filename = f"{cfg['prefix']}{file_info['name']}.xlsx"
+                self.output_path = os.path.join(cfg["output_dir"], filename)
             else:
                 # Use the original output path
                 self.output_path = os.path.expanduser(f"~/GoogleDriveMount/Web/Completed/Final/final_{file_info['name']}.xlsx")
             
             # Ensure the output directory exists
             os.makedirs(os.path.dirname(self.output_path), exist_ok=True)
-            
+            self._output_dir_ready = True
+
             # Save initial file
             self.save_results()
             
-            # Process rows
-            total_rows = len(df)
-            if total_rows == 0:
+            # Collect model numbers up front so the scrapes can be submitted
+            # to a bounded worker pool instead of running one at a time.
+            # Only this one column is needed, so pull it out as an array
+            # rather than boxing every row into a Series with iterrows
+            models = []
+            for model in df[model_col].astype(str).to_numpy():
+                if not model or model == 'nan':
+                    continue
+                models.append(model)
+
+            if not models:
                 self.signals.error.emit("File contains no data rows")
                 return
-            
+
+            # Source sheets often repeat model numbers; scrape each distinct
+            # model once and fan the result out to every occurrence
+            model_counts = {}
+            for model in models:
+                model_counts[model] = model_counts.get(model, 0) + 1
+            unique_models = list(model_counts)
+            total_rows = len(unique_models)
+
             # Update progress at start
-            self.signals.update_progress.emit(0, total_rows)
-            
-            for i, row_data in df.iterrows():
+            self._last_pct = -1
+            self._maybe_emit_progress(0, total_rows)
+
+            # Scrapes are network-bound, so a modest pool gives a near-linear
+            # wall-clock win; results stream back in completion order
+            if self.executor is None:
+                max_workers = cfg["max_workers"] if cfg is not None else 8
+                self.executor = ThreadPoolExecutor(max_workers=max_workers)
+
+            futures = {self.executor.submit(self.scrape_katom, model, prefix): model for model in unique_models}
+
+            # Rewriting the workbook after every row costs O(N) xlsx
+            # writes; batch the saves and do a final one after the loop
+            save_interval = cfg["save_interval"] if cfg is not None else 10
+            rows_since_save = 0
+
+            current_row = 0
+            for future in as_completed(futures):
                 if not self.running:
                     break
-                
-                current_row = i + 1
-                
-                # Get model number
-                model = str(row_data[model_col])
-                if not model or pd.isna(model):
-                    continue
-                
-                # Process the row
+
+                model = futures[future]
+                current_row += 1
+
+                # Process the result
                 try:
-                    self.signals.update_status.emit(f"Processing model: {model}")
-                    
-                    title, desc, specs_dict, specs_html, video_links = self.scrape_katom(model, prefix)
-                    
+                    self._maybe_emit_status(f"Processing model: {model}")
+
+                    title, desc, specs_dict, specs_html, video_links = future.result()
+
                     if title != "Title not found" and "not found" not in title.lower():
                         # Format the description with table at the bottom
                         combined_description = f'<div style="text-align: justify;">{desc}</div>'
@@ -815,59 +1363,62 @@ class SheetRow(QFrame):
                         if specs_html and len(specs_html) > 0:
                             combined_description += f'<h3 style="margin-top: 15px;">Specifications</h3>{specs_html}'
                         
-                        # Create a row with base data
-                        row_data = {
-                            "Mfr Model": model,
-                            "Title": title,
-                            "Description": combined_description
-                        }
-                        
-                        # Add each spec field to its own column if present
-                        for field in common_spec_fields:
-                            row_data[field.title()] = ""  # Initialize with empty string
-                        
+                        # Create a row from the template (spec and video
+                        # columns start out empty)
+                        row_data = row_template.copy()
+                        row_data["Mfr Model"] = model
+                        row_data["Title"] = title
+                        row_data["Description"] = combined_description
+
                         # Process spec dictionary and add to appropriate columns
                         for key, value in specs_dict.items():
+                            key_lower = key.lower()
+
                             # Process weight fields
-                            if "weight" in key.lower():
+                            if "weight" in key_lower:
                                 value = self.process_weight_value(value)
-                                
-                            # Try to match spec key to our common fields
-                            for field in common_spec_fields:
-                                if key.lower() == field.lower() or key.lower() in field.lower():
-                                    row_data[field.title()] = value
-                                    break
+
+                            # Exact match first, then the substring fallback
+                            title_col = field_title_map.get(key_lower)
+                            if title_col is None:
+                                title_col = next(
+                                    (field_title_map[f] for f in field_lower_list if key_lower in f),
+                                    None,
+                                )
+                            if title_col is not None:
+                                row_data[title_col] = value
                         
-                        # Process video links into separate columns
+                        # Process video links into separate columns (the
+                        # template already holds "" for unused slots)
                         video_list = [link.strip() for link in video_links.strip().split('\n') if link.strip()]
-                        for i, link in enumerate(video_list[:5], 1):  # Limit to 5 video links
-                            row_data[f"Video Link {i}"] = link
-                        
-                        # Initialize empty cells for unused video links
-                        for i in range(len(video_list) + 1, 6):
-                            if i <= 5:  # Ensure we don't exceed our column limit
-                                row_data[f"Video Link {i}"] = ""
-                        
-                        # Add to results DataFrame
-                        new_row = pd.DataFrame([row_data])
-                        self.output_df = pd.concat([self.output_df, new_row], ignore_index=True)
-                        
-                        # Save after each successful row
-                        self.save_results()
+                        for key, link in zip(_VIDEO_KEYS, video_list):  # Limit to 5 video links
+                            row_data[key] = link
+
+
+                        # Queue one output row per occurrence of the model
+                        # in the source file
+                        self._pending_rows.extend([row_data] * model_counts[model])
+
+                        # Save every save_interval rows rather than every row
+                        rows_since_save += model_counts[model]
+                        if rows_since_save >= save_interval:
+                            self.save_results()
+                            rows_since_save = 0
                 except Exception as e:
-                    print(f"Error processing row {current_row}: {e}")
+                    print(f"Error processing model {model}: {e}")
                     print(traceback.format_exc())
-                
+
                 # Update progress
-                self.signals.update_progress.emit(current_row, total_rows)
-                
-                # Small delay to prevent overloading
-                time.sleep(0.5)
+                self._maybe_emit_progress(current_row, total_rows)
             
+            # Final save picks up anything queued since the last interval
+            # save, whether we finished or were stopped mid-file
+            self.save_results()
+
             # Finish up
             if self.running:
                 # Plugin hook: after_process_file
-                if hasattr(self.parent, 'plugin_manager') and self.output_df is not None:
+                if has_plugins and self.output_df is not None:
                     self.parent.plugin_manager.execute_hook('after_process_file', self, self.output_df, self.output_path)
                     
                 self.signals.finished.emit()
@@ -881,13 +1432,19 @@ class SheetRow(QFrame):
             
     def load_file_data(self, file_info):
         """Load data from a file (Google Sheet or local file)"""
+        _ensure_pandas()
         if file_info['type'] == 'google_sheet':
             # Get sheet by name
             try:
                 sheet = self.parent.gc.open(file_info['name'])
                 worksheet = sheet.sheet1
-                records = worksheet.get_all_records()
-                return pd.DataFrame(records)
+                # get_all_values returns one 2D list; get_all_records built
+                # a dict per row just for pandas to take them apart again
+                values = worksheet.get_all_values()
+                if not values:
+                    return pd.DataFrame()
+                header, *rows = values
+                return pd.DataFrame(rows, columns=header)
             except Exception as e:
                 print(f"Error loading Google Sheet: {e}")
                 raise AppError(f"Failed to load Google Sheet: {str(e)}")
@@ -895,42 +1452,98 @@ class SheetRow(QFrame):
             # Local file
             path = file_info['path']
             if path.lower().endswith('.csv'):
-                return pd.read_csv(path)
-            elif path.lower().endswith(('.xlsx', '.xls')):
+                # Probe the header, then parse only the model column -
+                # downstream code reads nothing but 'Mfr Model', so there
+                # is no point materializing every spec column
+                header = pd.read_csv(path, nrows=0).columns
+                model_col = next(
+                    (c for c in header if isinstance(c, str) and c.strip().lower() == 'mfr model'),
+                    None,
+                )
+                if model_col is None:
+                    # Let process_file report the missing column as usual
+                    return pd.read_csv(path)
+                return pd.read_csv(path, usecols=[model_col], dtype={model_col: str})
+            elif path.lower().endswith('.xlsx'):
+                # Read-only mode streams the sheet instead of building the
+                # whole workbook in memory; pull out just the model column
+                try:
+                    _ensure_openpyxl()
+                    workbook = openpyxl.load_workbook(path, read_only=True, data_only=True)
+                    try:
+                        rows = workbook.active.iter_rows(values_only=True)
+                        header = next(rows, None) or ()
+                        model_col = next(
+                            (c for c in header if isinstance(c, str) and c.strip().lower() == 'mfr model'),
+                            None,
+                        )
+                        if model_col is not None:
+                            idx = header.index(model_col)
+                            # Blank cells stream back as None; astype(str)
+                            # would turn them into 'None', which slips past
+                            # the 'nan' filter and gets scraped literally
+                            values = [row[idx] for row in rows
+                                      if idx < len(row) and row[idx] is not None]
+                            return pd.DataFrame({model_col: values})
+                    finally:
+                        workbook.close()
+                except Exception as e:
+                    print(f"Read-only xlsx load failed, falling back to read_excel: {e}")
+                return pd.read_excel(path)
+            elif path.lower().endswith('.xls'):
+                # Legacy format openpyxl cannot stream
                 return pd.read_excel(path)
             else:
                 raise AppError(f"Unsupported file type: {path}")
     
     def save_results(self):
         """Save the current results to the output file with consistent cell heights"""
-        if self.output_df is not None and self.output_path:
+        if self._columns is not None and self.output_path:
             try:
-                # Ensure the output directory exists
-                os.makedirs(os.path.dirname(self.output_path), exist_ok=True)
-                
-                # First save using pandas to Excel
-                self.output_df.to_excel(self.output_path, index=False)
-                
-                # Then open with openpyxl to adjust cell heights
-                workbook = openpyxl.load_workbook(self.output_path)
-                worksheet = workbook.active
-                
-                # Set default row height for all rows
+                _ensure_pandas()
+                _ensure_openpyxl()
+
+                # Ensure the output directory exists (process_file already
+                # created it; only pay the syscall if it hasn't)
+                if not self._output_dir_ready:
+                    os.makedirs(os.path.dirname(self.output_path), exist_ok=True)
+                    self._output_dir_ready = True
+
+                # Materialize the accumulated rows in one allocation
+                # (kept current for plugin hooks and the formatter wrapper)
+                self.output_df = pd.DataFrame(self._pending_rows, columns=self._columns)
+
+                # Stream the sheet once with a write-only workbook - no
+                # to_excel/load_workbook round trip, no cell-by-cell
+                # height fixups, memory stays bounded by one row
+                workbook = openpyxl.Workbook(write_only=True)
+                worksheet = workbook.create_sheet()
                 # Standard default height in Excel is 15 points
-                for row in worksheet.iter_rows():
-                    worksheet.row_dimensions[row[0].row].height = 15
-                
-                # Adjust the wrap text settings for the Description column
-                for row in worksheet.iter_rows():
-                    for cell in row:
-                        col_name = worksheet.cell(row=1, column=cell.column).value
-                        if col_name == "Description":
-                            cell.alignment = Alignment(wrap_text=True)
-                
-                # Save the modified workbook
+                worksheet.sheet_format.defaultRowHeight = 15
+
+                try:
+                    desc_idx = self._columns.index("Description")
+                except ValueError:
+                    desc_idx = -1
+                wrap_alignment = Alignment(wrap_text=True)
+
+                worksheet.append(self._columns)
+                for row_data in self._pending_rows:
+                    cells = []
+                    for idx, col in enumerate(self._columns):
+                        value = row_data.get(col, "")
+                        if idx == desc_idx:
+                            cell = WriteOnlyCell(worksheet, value=value)
+                            cell.alignment = wrap_alignment
+                            cells.append(cell)
+                        else:
+                            cells.append(value)
+                    worksheet.append(cells)
+
                 workbook.save(self.output_path)
                 workbook.close()  # Explicitly close workbook to release file lock
-                
+
+
             except Exception as e:
                 print(f"Error saving results: {e}")
                 print(traceback.format_exc())
@@ -942,7 +1555,11 @@ class MainWindow(QWidget):
         
         # Initialize configuration system
         self.config_manager = ConfigManager()
-        
+
+        # Snapshot hot config values; process_file reads the snapshot
+        # instead of traversing the config dict per file
+        self._refresh_config_cache()
+
         # Initialize the Google Sheets client
         try:
             self.authenticate_google_drive()
@@ -959,6 +1576,14 @@ class MainWindow(QWidget):
         # For sequential processing
         self.processing_queue = []
         self.current_processing_index = -1
+
+        # Short-lived cache of the Web folder listing (see get_drive_web_files)
+        self._drive_files_cache = None
+        self._drive_files_cache_ts = 0.0
+
+        # Freelist of constructed SheetRows; cleared rows are reset and
+        # parked here so add_row can skip the widget/stylesheet build
+        self._row_pool = []
         
         # Initialize plugin system
         self.plugin_manager = PluginManager(self)
@@ -967,6 +1592,10 @@ class MainWindow(QWidget):
     def authenticate_google_drive(self):
         """Connect to Google Drive API"""
         try:
+            # Deferred imports - the Google stack is only needed here
+            import gspread
+            from oauth2client.service_account import ServiceAccountCredentials
+
             creds_path = os.path.expanduser("~/GoogleDriveMount/Web/zapier-454818-4e4abf368f57.json")
             scope = ["https://spreadsheets.google.com/feeds", "https://www.googleapis.com/auth/drive"]
             creds = ServiceAccountCredentials.from_json_keyfile_name(creds_path, scope)
@@ -976,23 +1605,29 @@ class MainWindow(QWidget):
     
     def get_drive_web_files(self):
         """Get list of available files from local Web folder only"""
+        # Serve a recent snapshot so bursts of row refreshes (adding rows,
+        # changing a selection) don't each re-scan the mounted folder
+        if self._drive_files_cache is not None and time.monotonic() - self._drive_files_cache_ts < 2.0:
+            return self._drive_files_cache
+
         try:
             # Only get files from the local Web folder
             web_folder = os.path.expanduser("~/GoogleDriveMount/Web/")
             local_files = []
             
             if os.path.exists(web_folder):
-                print(f"Looking for files in: {web_folder}")
-                for filename in os.listdir(web_folder):
-                    full_path = os.path.join(web_folder, filename)
-                    # Only include files, not directories
-                    if os.path.isfile(full_path):
-                        if filename.endswith(('.csv', '.xlsx', '.xls')) and not filename.startswith('final_'):
+                # scandir's DirEntry carries the file type from the listing
+                # itself - no isfile() stat syscall per entry
+                with os.scandir(web_folder) as entries:
+                    for entry in entries:
+                        filename = entry.name
+                        if (entry.is_file()
+                                and filename.endswith(('.csv', '.xlsx', '.xls'))
+                                and not filename.startswith('final_')):
                             local_files.append(filename)
-                            print(f"Found file: {filename}")
-            
+
             print(f"Found {len(local_files)} files in local Web folder")
-            
+
             if not local_files:
                 # Just for debugging, list all directories and files in parent directory
                 parent_dir = os.path.dirname(web_folder)
@@ -1000,8 +1635,10 @@ class MainWindow(QWidget):
                     print(f"Contents of parent directory ({parent_dir}):")
                     for item in os.listdir(parent_dir):
                         print(f"  - {item}")
-            
-            return sorted(local_files)
+
+            self._drive_files_cache = sorted(local_files)
+            self._drive_files_cache_ts = time.monotonic()
+            return self._drive_files_cache
         except Exception as e:
             print(f"Error listing files: {e}")
             print(traceback.format_exc())
@@ -1183,10 +1820,25 @@ class MainWindow(QWidget):
         main_layout.addLayout(button_layout)
         main_layout.addWidget(self.scroll_area, 1)  # 1 = stretch factor
     
+    def _refresh_config_cache(self):
+        """Snapshot the config values the processing path reads repeatedly"""
+        cfg = self.config_manager
+        self._cfg = {
+            "common_spec_fields": cfg.get("common_spec_fields"),
+            "output_dir": os.path.expanduser(cfg.get("output", "output_dir")),
+            "prefix": cfg.get("output", "prefix"),
+            "save_interval": cfg.get("output", "save_interval") or 10,
+            "max_workers": cfg.get("scraping", "max_workers") or 8,
+        }
+
     def show_settings(self):
         """Show the settings dialog"""
         dialog = SettingsDialog(self.config_manager, self)
         dialog.exec_()
+
+        # The dialog writes straight to the config manager, so rebuild the
+        # snapshot once it closes
+        self._refresh_config_cache()
     
     def show_plugin_manager(self):
         """Show the plugin manager dialog"""
@@ -1196,13 +1848,21 @@ class MainWindow(QWidget):
     def add_row(self):
         """Add a new row to the interface"""
         try:
-            # Create new SheetRow
-            row = SheetRow(len(self.scroll_layout), self)
-            
-            # Apply enhancements
-            row = create_webscraper_wrapper(row)
-            row = enhance_save_results(row)
-            
+            if self._row_pool:
+                # Reuse a pooled row - already built, enhanced and reset
+                row = self._row_pool.pop()
+                row.index = self.scroll_layout.count()
+                row.setObjectName(f"SheetRow_{row.index}")
+                row.setParent(self)
+                QTimer.singleShot(500, row.load_files)
+            else:
+                # Create new SheetRow
+                row = SheetRow(len(self.scroll_layout), self)
+
+                # Apply enhancements
+                row = create_webscraper_wrapper(row)
+                row = enhance_save_results(row)
+
             # Force UI update before adding it
             QApplication.processEvents()
             
@@ -1224,14 +1884,15 @@ class MainWindow(QWidget):
             QMessageBox.warning(self, "Error", f"Error adding new row: {str(e)}")
     
     def refresh_all_rows(self):
-        """Refresh file lists in all rows"""
+        """Refresh file lists in all rows from a single folder listing"""
         try:
+            all_files = self.get_drive_web_files()
             for i in range(self.scroll_layout.count()):
                 item = self.scroll_layout.itemAt(i)
                 if item:
                     row = item.widget()
                     if row and not row.running:
-                        row.load_files()
+                        row.load_files(all_files)
         except Exception as e:
             print(f"Error refreshing rows: {e}")
             # Don't crash the application if refresh fails
@@ -1261,11 +1922,18 @@ class MainWindow(QWidget):
         # Stop all running processes
         self.stop_all()
         
-        # Clear all rows
+        # Clear all rows, parking them in the pool for reuse
         while self.scroll_layout.count():
             item = self.scroll_layout.takeAt(0)
             if item and item.widget():
-                item.widget().deleteLater()
+                row = item.widget()
+                try:
+                    row.reset_state()
+                    row.setParent(None)
+                    self._row_pool.append(row)
+                except Exception as e:
+                    print(f"Error pooling row, discarding it: {e}")
+                    row.deleteLater()
         
         # Reset status
         self.update_status("Ready")
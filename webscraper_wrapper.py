@@ -22,15 +22,14 @@ def create_webscraper_wrapper(sheet_row):
     # Define the wrapper function
     def wrapped_scrape_katom(model_number, prefix):
         try:
-            # Log the scraping attempt
-            print(f"Enhanced scraping for model: {model_number} with prefix: {prefix}")
-            
-            # Use the facade to scrape
-            return scraper.scrape_katom(model_number, prefix, sheet_row.signals)
-        except Exception as e:
-            print(f"Error in enhanced scraping, falling back to original method: {e}")
-            # Fall back to original method if facade fails
+            # The row's own scrape path is the fast one - pooled HTTP
+            # fetches, the on-disk cache and reusable drivers all live
+            # there - so it goes first; the facade's standalone Selenium
+            # scrape is kept as the fallback if it fails outright
             return original_scrape_katom(model_number, prefix)
+        except Exception as e:
+            print(f"Error in row scrape path, falling back to facade: {e}")
+            return scraper.scrape_katom(model_number, prefix, sheet_row.signals)
     
     # Replace the original method with our wrapped version
     sheet_row.scrape_katom = wrapped_scrape_katom